@@ -12,7 +12,7 @@ from jaunt import paths
 from jaunt.digest import extract_source_segment, module_digest
 from jaunt.errors import JauntDependencyCycleError
 from jaunt.generate.base import GeneratorBackend, ModuleSpecContext
-from jaunt.header import extract_module_digest, format_header
+from jaunt.header import format_header, read_header
 from jaunt.registry import SpecEntry
 from jaunt.spec_ref import SpecRef
 from jaunt.validation import validate_generated_source
@@ -118,12 +118,12 @@ def detect_stale_modules(
             continue
 
         try:
-            existing = out_path.read_text(encoding="utf-8")
+            header = read_header(out_path)
         except Exception:
             stale.add(module_name)
             continue
 
-        on_disk = _normalize_digest(extract_module_digest(existing))
+        on_disk = _normalize_digest(header.get("module_digest") if header else None)
         computed = _normalize_digest(module_digest(module_name, entries, specs, spec_graph))
         if on_disk is None or computed is None or on_disk != computed:
             stale.add(module_name)
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import sys
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -83,14 +84,20 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    # Parsing does not mutate the parser, so build the subcommand tree once.
+    return _build_parser()
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
-    return _build_parser().parse_args(argv)
+    return _get_parser().parse_args(argv)
 
 
 def _iter_target_modules(targets: Iterable[str]) -> set[str]:
     out: set[str] = set()
     for t in targets:
-        mod = (t or "").split(":", 1)[0].strip()
+        mod = (t or "").partition(":")[0].strip()
         if mod:
             out.add(mod)
     return out
@@ -404,6 +411,12 @@ def cmd_test(args: argparse.Namespace) -> int:
         return EXIT_GENERATION_ERROR
 
 
+_DISPATCH: dict[str, Callable[[argparse.Namespace], int]] = {
+    "build": cmd_build,
+    "test": cmd_test,
+}
+
+
 def main(argv: list[str] | None = None) -> int:
     try:
         args = parse_args(list(sys.argv[1:] if argv is None else argv))
@@ -412,12 +425,10 @@ def main(argv: list[str] | None = None) -> int:
         code = e.code
         return int(code) if isinstance(code, int) else EXIT_CONFIG_OR_DISCOVERY
 
-    if args.command == "build":
-        return cmd_build(args)
-    if args.command == "test":
-        return cmd_test(args)
-
-    return EXIT_CONFIG_OR_DISCOVERY
+    cmd = _DISPATCH.get(args.command)
+    if cmd is None:
+        return EXIT_CONFIG_OR_DISCOVERY
+    return cmd(args)
 
 
 if __name__ == "__main__":
@@ -115,13 +115,28 @@ def _as_str(value: Any, *, name: str) -> str:
     return value
 
 
-def load_config(*, root: Path | None = None, config_path: Path | None = None) -> JauntConfig:
+def load_config(
+    *,
+    root: Path | None = None,
+    config_path: Path | None = None,
+    toml_text: str | None = None,
+) -> JauntConfig:
     """Load and validate `jaunt.toml`.
 
     If neither `root` nor `config_path` are provided, the project root is
     discovered by walking upward from the current working directory.
+
+    If `toml_text` is provided it is parsed instead of reading a file. It then
+    requires `root` (used to validate the configured paths) and rejects
+    `config_path`, since neither could be derived from the text.
     """
 
+    if toml_text is not None:
+        if root is None:
+            raise ValueError("load_config(toml_text=...) requires root")
+        if config_path is not None:
+            raise ValueError("load_config(toml_text=...) does not accept config_path")
+
     if config_path is None:
         if root is None:
             root = find_project_root(Path.cwd())
@@ -132,19 +147,26 @@ def load_config(*, root: Path | None = None, config_path: Path | None = None) ->
 
     assert root is not None
 
-    try:
-        raw = config_path.read_bytes()
-    except FileNotFoundError as e:
-        raise JauntConfigError(f"Missing jaunt.toml at: {config_path}") from e
-    except OSError as e:
-        raise JauntConfigError(f"Failed reading config file: {config_path}") from e
+    if toml_text is not None:
+        origin = "in-memory config text"
+    else:
+        origin = str(config_path)
+        try:
+            raw = config_path.read_bytes()
+        except FileNotFoundError as e:
+            raise JauntConfigError(f"Missing jaunt.toml at: {config_path}") from e
+        except OSError as e:
+            raise JauntConfigError(f"Failed reading config file: {config_path}") from e
+
+        try:
+            toml_text = raw.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise JauntConfigError(f"Config is not valid UTF-8: {config_path}") from e
 
     try:
-        data = tomllib.loads(raw.decode("utf-8"))
-    except UnicodeDecodeError as e:
-        raise JauntConfigError(f"Config is not valid UTF-8: {config_path}") from e
+        data = tomllib.loads(toml_text)
     except tomllib.TOMLDecodeError as e:
-        raise JauntConfigError(f"Invalid TOML in {config_path}: {e}") from e
+        raise JauntConfigError(f"Invalid TOML in {origin}: {e}") from e
 
     version = data.get("version", None)
     if version is None:
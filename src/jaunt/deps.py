@@ -6,22 +6,23 @@ optionally infers additional edges from best-effort AST analysis.
 Graph representation convention:
 - A graph is a dict[node, set[dep_nodes]] (edges point to dependencies).
 - Toposort returns a list where dependencies come before dependents.
+- find_cycles returns each cycle as a sorted list of its participants.
 """
 
 from __future__ import annotations
 
 import ast
+import itertools
+import sys
+from collections import deque
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TypeVar
 
 from jaunt.errors import JauntDependencyCycleError
 from jaunt.registry import SpecEntry
 from jaunt.spec_ref import SpecRef, normalize_spec_ref, spec_ref_from_object
 
-K = TypeVar("K")
-
 
 def _iter_deps_value(value: object) -> Iterable[object]:
     if value is None:
@@ -46,6 +47,7 @@ def _normalize_dep(dep: object) -> SpecRef | None:
 class _ModuleParse:
     source: str
     tree: ast.Module
+    top_level: dict[str, ast.AST]
     import_aliases: dict[str, str]
     from_imports: dict[str, str]
 
@@ -60,12 +62,17 @@ def _parse_module_once(path: str, *, cache: dict[str, _ModuleParse]) -> _ModuleP
     except Exception:
         return None
 
+    top_level: dict[str, ast.AST] = {}
     import_aliases: dict[str, str] = {}
     from_imports: dict[str, str] = {}
 
     # Best-effort import tracking for simple name and attribute resolution.
+    # Top-level defs are indexed in the same pass so every spec in the module
+    # resolves its node with a dict lookup (first definition wins).
     for node in tree.body:
-        if isinstance(node, ast.Import):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            top_level.setdefault(node.name, node)
+        elif isinstance(node, ast.Import):
             for alias in node.names:
                 bound = alias.asname or alias.name.split(".", 1)[0]
                 import_aliases[bound] = alias.name
@@ -80,6 +87,7 @@ def _parse_module_once(path: str, *, cache: dict[str, _ModuleParse]) -> _ModuleP
     parsed = _ModuleParse(
         source=src,
         tree=tree,
+        top_level=top_level,
         import_aliases=import_aliases,
         from_imports=from_imports,
     )
@@ -87,16 +95,6 @@ def _parse_module_once(path: str, *, cache: dict[str, _ModuleParse]) -> _ModuleP
     return parsed
 
 
-def _find_top_level_node(module: ast.Module, *, name: str) -> ast.AST | None:
-    for node in module.body:
-        if (
-            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
-            and node.name == name
-        ):
-            return node
-    return None
-
-
 class _NameUseCollector(ast.NodeVisitor):
     def __init__(self) -> None:
         self.names: set[str] = set()
@@ -162,7 +160,7 @@ def build_spec_graph(
             if parsed is None:
                 continue
 
-            node = _find_top_level_node(parsed.tree, name=entry.qualname)
+            node = parsed.top_level.get(entry.qualname)
             if node is None:
                 continue
 
@@ -204,60 +202,139 @@ def build_spec_graph(
 def collapse_to_module_dag(spec_graph: dict[SpecRef, set[SpecRef]]) -> dict[str, set[str]]:
     """Collapse a spec dependency graph into a module-level graph."""
 
-    module_graph: dict[str, set[str]] = {}
-
-    def mod_of(sr: SpecRef) -> str:
-        return str(sr).split(":", 1)[0]
+    # Split each ref once, including refs that only appear as deps.
+    mod_of: dict[SpecRef, str] = {}
+    for sr, deps in spec_graph.items():
+        for ref in (sr, *deps):
+            if ref not in mod_of:
+                mod_of[ref] = sys.intern(str(ref).partition(":")[0])
 
+    module_graph: dict[str, set[str]] = {m: set() for m in mod_of.values()}
     for sr, deps in spec_graph.items():
-        m = mod_of(sr)
-        module_graph.setdefault(m, set())
-        for dep in deps:
-            dm = mod_of(dep)
-            module_graph.setdefault(dm, set())
-            if dm != m:
-                module_graph[m].add(dm)
+        m = mod_of[sr]
+        module_graph[m].update(mod_of[dep] for dep in deps)
+
+    # Same-module edges collapse into self edges; drop them in one pass.
+    for m, deps in module_graph.items():
+        deps.discard(m)
 
     return module_graph
 
 
-def toposort(graph: dict[K, set[K]]) -> list[K]:
-    """Topologically sort a dependency graph (deps before dependents)."""
+def find_cycles[K](graph: dict[K, set[K]]) -> list[list[K]]:
+    """Return every dependency cycle in `graph`.
 
-    perm: set[K] = set()
-    temp: set[K] = set()
-    order: list[K] = []
-    stack: list[K] = []
-
-    def visit(n: K) -> None:
-        if n in perm:
-            return
-        if n in temp:
-            # Extract a cycle path from the current recursion stack.
-            try:
-                i = stack.index(n)
-            except ValueError:
-                i = 0
-            cycle = stack[i:] + [n]
-            msg = "Dependency cycle detected: " + " -> ".join(str(x) for x in cycle)
-            raise JauntDependencyCycleError(msg)
-
-        temp.add(n)
-        stack.append(n)
-        for dep in sorted(graph.get(n, set()), key=lambda x: str(x)):
-            visit(dep)
-        stack.pop()
-        temp.remove(n)
-        perm.add(n)
-        order.append(n)
+    Uses an iterative Tarjan SCC pass (linear time, no recursion). Each cycle is
+    a strongly connected component with more than one node, or a single node
+    that depends on itself. Output is sorted so error messages are stable.
+    """
+
+    def deps_of(n: K) -> list[K]:
+        return sorted(graph.get(n, set()), key=lambda x: str(x))
+
+    all_nodes: set[K] = set(graph.keys())
+    for deps in graph.values():
+        all_nodes.update(deps)
+
+    counter = itertools.count()
+    index: dict[K, int] = {}
+    lowlink: dict[K, int] = {}
+    on_stack: set[K] = set()
+    scc_stack: list[K] = []
+    cycles: list[list[K]] = []
+
+    for root in sorted(all_nodes, key=lambda x: str(x)):
+        if root in index:
+            continue
+        index[root] = lowlink[root] = next(counter)
+        scc_stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(deps_of(root)))]
+
+        while work:
+            node, it = work[-1]
+            for dep in it:
+                if dep not in index:
+                    index[dep] = lowlink[dep] = next(counter)
+                    scc_stack.append(dep)
+                    on_stack.add(dep)
+                    work.append((dep, iter(deps_of(dep))))
+                    break
+                if dep in on_stack:
+                    lowlink[node] = min(lowlink[node], index[dep])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] != index[node]:
+                    continue
+                scc: list[K] = []
+                while True:
+                    member = scc_stack.pop()
+                    on_stack.discard(member)
+                    scc.append(member)
+                    if member == node:
+                        break
+                if len(scc) > 1 or node in graph.get(node, set()):
+                    cycles.append(sorted(scc, key=lambda x: str(x)))
+
+    cycles.sort(key=lambda c: [str(x) for x in c])
+    return cycles
+
+
+def _cycle_path[K](graph: dict[K, set[K]], members: list[K]) -> list[K]:
+    # Walk smallest in-cycle deps from the first member until a node repeats, so
+    # the message shows a real path rather than just the member set.
+    inside = set(members)
+    path: list[K] = []
+    seen: dict[K, int] = {}
+    node = members[0]
+    while node not in seen:
+        seen[node] = len(path)
+        path.append(node)
+        node = min((d for d in graph.get(node, set()) if d in inside), key=lambda x: str(x))
+    return path[seen[node] :] + [node]
+
+
+def toposort[K](graph: dict[K, set[K]]) -> list[K]:
+    """Topologically sort a dependency graph (deps before dependents).
+
+    Kahn's algorithm over indegree counts. The initially ready nodes are taken in
+    ``str`` order and each node releases its dependents in that same order, so the
+    result is deterministic for a given graph (though not the lexicographically
+    smallest ordering). Cycles are only enumerated (via find_cycles) once the sort
+    gets stuck.
+    """
 
     # Ensure nodes that only appear as deps are also considered.
     all_nodes: set[K] = set(graph.keys())
     for deps in graph.values():
         all_nodes.update(deps)
+    nodes = sorted(all_nodes, key=lambda x: str(x))
+
+    remaining: dict[K, int] = {}
+    dependents: dict[K, list[K]] = {n: [] for n in nodes}
+    for n in nodes:
+        deps = graph.get(n, set())
+        remaining[n] = len(deps)
+        for dep in deps:
+            dependents[dep].append(n)
 
-    for node in sorted(all_nodes, key=lambda x: str(x)):
-        if node not in perm:
-            visit(node)
+    ready = deque(n for n in nodes if remaining[n] == 0)
+    order: list[K] = []
+    while ready:
+        n = ready.popleft()
+        order.append(n)
+        for dependent in dependents[n]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+
+    if len(order) != len(nodes):
+        stuck = {n: graph.get(n, set()) for n in nodes if remaining[n] > 0}
+        cycle = _cycle_path(stuck, find_cycles(stuck)[0])
+        msg = "Dependency cycle detected: " + " -> ".join(str(x) for x in cycle)
+        raise JauntDependencyCycleError(msg)
 
     return order
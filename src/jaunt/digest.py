@@ -6,6 +6,8 @@ import ast
 import hashlib
 import json
 import textwrap
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 
 from jaunt.errors import JauntDependencyCycleError
@@ -13,20 +15,50 @@ from jaunt.registry import SpecEntry
 from jaunt.spec_ref import SpecRef, normalize_spec_ref, spec_ref_from_object
 
 
-def extract_source_segment(entry: SpecEntry) -> str:
-    """Extract a normalized source segment for the entry's top-level definition."""
+@dataclass(frozen=True, slots=True)
+class _ParsedSource:
+    data: bytes
+    source: str
+    top_level: dict[str, ast.AST]
+
 
-    src = Path(entry.source_file).read_text(encoding="utf-8")
-    tree = ast.parse(src, filename=entry.source_file)
+# Specs from one module all extract from the same file, and builds hash and then
+# prompt with the same segments. Reading bytes is cheap; decoding and parsing is
+# not, so reuse the parse while the file's bytes are unchanged. Bounded LRU: the
+# segments of a module are extracted together, so a few recent files suffice.
+_PARSED_SOURCES_MAX = 32
+_PARSED_SOURCES: OrderedDict[str, _ParsedSource] = OrderedDict()
 
-    node: ast.AST | None = None
+
+def _parse_source(path: str) -> _ParsedSource:
+    data = Path(path).read_bytes()
+    cached = _PARSED_SOURCES.get(path)
+    if cached is not None and cached.data == data:
+        _PARSED_SOURCES.move_to_end(path)
+        return cached
+
+    # Same newline handling as Path.read_text (universal newlines).
+    src = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    tree = ast.parse(src, filename=path)
+    top_level: dict[str, ast.AST] = {}
     for top in tree.body:
-        if (
-            isinstance(top, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
-            and top.name == entry.qualname
-        ):
-            node = top
-            break
+        if isinstance(top, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            top_level.setdefault(top.name, top)
+
+    parsed = _ParsedSource(data=data, source=src, top_level=top_level)
+    _PARSED_SOURCES[path] = parsed
+    _PARSED_SOURCES.move_to_end(path)
+    if len(_PARSED_SOURCES) > _PARSED_SOURCES_MAX:
+        _PARSED_SOURCES.popitem(last=False)
+    return parsed
+
+
+def extract_source_segment(entry: SpecEntry) -> str:
+    """Extract a normalized source segment for the entry's top-level definition."""
+
+    parsed = _parse_source(entry.source_file)
+    src = parsed.source
+    node = parsed.top_level.get(entry.qualname)
 
     if node is None:
         raise ValueError(f"Top-level definition not found for {entry.spec_ref!s}")
@@ -96,8 +128,10 @@ def local_digest(entry: SpecEntry) -> str:
             kwargs[k] = _jsonable(v)
 
     stable = json.dumps(kwargs, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-    payload = (seg + "\n" + stable).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+    h = hashlib.sha256(seg.encode("utf-8"))
+    h.update(b"\n")
+    h.update(stable.encode("utf-8"))
+    return h.hexdigest()
 
 
 def graph_digest(
@@ -119,12 +153,16 @@ def graph_digest(
             raise JauntDependencyCycleError(f"Dependency cycle detected while hashing: {sr!s}")
 
         visiting.add(sr)
-        local = local_digest(specs[sr])
-        dep_digests = [
-            compute(dep) for dep in sorted(spec_graph.get(sr, set()), key=lambda x: str(x))
-        ]
-        payload = (local + "\n" + "\n".join(dep_digests)).encode("utf-8")
-        d = hashlib.sha256(payload).hexdigest()
+        # Feed parts straight into one hasher; the byte stream is the same as
+        # hashing "local\n" + "\n".join(dep_digests), so digests stay stable.
+        h = hashlib.sha256(local_digest(specs[sr]).encode("ascii"))
+        h.update(b"\n")
+        sep = b""
+        for dep in sorted(spec_graph.get(sr, set()), key=lambda x: str(x)):
+            h.update(sep)
+            h.update(compute(dep).encode("ascii"))
+            sep = b"\n"
+        d = h.hexdigest()
         memo[sr] = d
         visiting.remove(sr)
         return d
@@ -145,5 +183,10 @@ def module_digest(
     for entry in sorted(module_specs, key=lambda e: str(e.spec_ref)):
         digests.append(graph_digest(entry.spec_ref, specs, spec_graph, cache=cache))
 
-    payload = "\n".join(sorted(digests)).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+    h = hashlib.sha256()
+    sep = b""
+    for d in sorted(digests):
+        h.update(sep)
+        h.update(d.encode("ascii"))
+        sep = b"\n"
+    return h.hexdigest()
@@ -8,27 +8,68 @@ from __future__ import annotations
 
 import fnmatch
 import importlib
+import os
+import re
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Literal
 
 from jaunt.errors import JauntDiscoveryError
 
 
-def _is_excluded(rel_posix: str, *, exclude: list[str]) -> bool:
-    # Patterns are matched against a posix-style relative path.
+def _exclude_matcher(exclude: list[str]) -> re.Pattern[str] | None:
+    # One union regex per pattern set, matched against posix-style relative
+    # paths: each file costs a single match call no matter how many globs are
+    # configured.
+    variants: list[str] = []
     for pat in exclude:
-        if fnmatch.fnmatchcase(rel_posix, pat):
-            return True
+        variants.append(fnmatch.translate(pat))
 
         # `fnmatch` doesn't treat a leading `**/` as "zero or more directories",
         # but the prompt's examples do. Normalize by stripping leading `**/`.
         stripped = pat
         while stripped.startswith("**/"):
             stripped = stripped[3:]
-            if fnmatch.fnmatchcase(rel_posix, stripped):
-                return True
+            variants.append(fnmatch.translate(stripped))
 
-    return False
+    if not variants:
+        return None
+    return re.compile("|".join(variants))
+
+
+def _iter_py_files(root: Path, *, exclude: list[str], generated_dir: str) -> Iterator[str]:
+    """Yield posix paths, relative to `root`, of `.py` files under `root`.
+
+    Walks with `os.scandir` and never descends into `generated_dir` or into a
+    directory every file of which would be excluded anyway. Like `Path.rglob`,
+    symlinked directories are not followed.
+    """
+
+    # A pattern ending in `*` that matches "dir/" matches everything below it.
+    prune = _exclude_matcher([pat for pat in exclude if pat.endswith("*")])
+    root_s = os.fspath(root)
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            it = os.scandir(os.path.join(root_s, rel_dir) if rel_dir else root_s)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name == generated_dir:
+                            continue
+                        if prune is not None and prune.match(rel + "/"):
+                            continue
+                        stack.append(rel)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield rel
+                except OSError:
+                    continue
 
 
 def discover_modules(
@@ -49,37 +90,30 @@ def discover_modules(
 
     module_names: set[str] = set()
     prefix = module_prefix or None
+    excluded = _exclude_matcher(exclude)
 
     for root in roots:
-        for py_file in root.rglob("*.py"):
-            if not py_file.is_file():
-                continue
-
-            rel = py_file.relative_to(root)
-            if generated_dir and generated_dir in rel.parts:
-                continue
-
-            rel_posix = rel.as_posix()
-            if _is_excluded(rel_posix, exclude=exclude):
+        for rel_posix in _iter_py_files(root, exclude=exclude, generated_dir=generated_dir):
+            if excluded is not None and excluded.match(rel_posix):
                 continue
 
-            if rel.name == "__init__.py":
-                base_mod = ".".join(rel.parent.parts)
+            if rel_posix == "__init__.py" or rel_posix.endswith("/__init__.py"):
+                base_mod = rel_posix[: -len("__init__.py")].rstrip("/").replace("/", ".")
             else:
-                base_mod = ".".join(rel.with_suffix("").parts)
+                base_mod = rel_posix[: -len(".py")].replace("/", ".")
 
             if base_mod == "":
                 # Root-level __init__.py doesn't map to a sensible module name
                 # unless the caller provides a namespace prefix (ex: tests).
                 if prefix is None:
                     continue
-                module_names.add(prefix)
+                module_names.add(sys.intern(prefix))
                 continue
 
             if prefix is None:
-                module_names.add(base_mod)
+                module_names.add(sys.intern(base_mod))
             else:
-                module_names.add(f"{prefix}.{base_mod}")
+                module_names.add(sys.intern(f"{prefix}.{base_mod}"))
 
     return sorted(module_names)
 
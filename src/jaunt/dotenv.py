@@ -1,28 +1,29 @@
 from __future__ import annotations
 
 import os
+import re
 from pathlib import Path
 
+# One `KEY=VALUE` assignment, matched against a single line: optional leading
+# whitespace (possessive, so a `#` comment cannot be skipped past), optional
+# `export `, then the key up to the first `=`. Lines without `=` never match.
+_ASSIGNMENT_RE = re.compile(r"\s*+(?!#)(?:export )?(?P<key>[^=]*)=(?P<value>.*)")
+
 
 def load_dotenv(path: Path) -> dict[str, str]:
     """Parse a tiny subset of .env files (KEY=VALUE, no interpolation)."""
 
     out: dict[str, str] = {}
     text = path.read_text(encoding="utf-8")
-    for raw_line in text.splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("export "):
-            line = line[len("export ") :].lstrip()
-        if "=" not in line:
+    # `str.splitlines` also breaks on \f, \v, \x1c-\x1e, \x85, \u2028 and \u2029.
+    for line in text.splitlines():
+        m = _ASSIGNMENT_RE.match(line)
+        if m is None:
             continue
-
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip()
+        key = m["key"].strip()
         if not key:
             continue
+        value = m["value"].strip()
 
         # Very small quoting support; matches common .env usage.
         if len(value) >= 2 and value[0] in ("'", '"') and value[-1] == value[0]:
@@ -52,4 +53,3 @@ def load_dotenv_into_environ(path: Path) -> bool:
             continue
         os.environ[k] = v
     return True
-
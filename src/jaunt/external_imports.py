@@ -9,6 +9,7 @@ from importlib import metadata
 from pathlib import Path
 
 _PEP503_RE = re.compile(r"[-_.]+")
+_STDLIB_TOP_LEVELS: frozenset[str] = frozenset(getattr(sys, "stdlib_module_names", ()))
 
 
 def pep503_normalize(name: str) -> str:
@@ -161,7 +162,6 @@ def discover_external_distributions_with_warnings(
 
     warnings: list[str] = []
     internal = _discover_internal_top_levels(source_roots=source_roots)
-    stdlib = getattr(sys, "stdlib_module_names", set())
 
     imports: set[str] = set()
     for py_file in _iter_python_files(roots=source_roots, generated_dir=generated_dir):
@@ -187,7 +187,7 @@ def discover_external_distributions_with_warnings(
         # Ignore it so auto-skill generation doesn't warn noisily.
         if top == "jaunt":
             continue
-        if top in stdlib:
+        if top in _STDLIB_TOP_LEVELS:
             continue
         if top in internal:
             continue
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
 from typing import Literal
 
 HEADER_MARKER = "# This file was generated by jaunt. DO NOT EDIT."
@@ -59,3 +60,17 @@ def extract_module_digest(source: str) -> str | None:
         return None
     return parsed.get("module_digest")
 
+
+def read_header(path: Path) -> dict[str, str] | None:
+    """Parse the Jaunt header from a file without reading the generated body."""
+
+    with path.open("r", encoding="utf-8") as f:
+        first = f.readline()
+        if first.rstrip("\r\n") != HEADER_MARKER:
+            return None
+        lines = [first]
+        for line in f:
+            if not line.startswith("# jaunt:"):
+                break
+            lines.append(line)
+    return parse_header("".join(lines))
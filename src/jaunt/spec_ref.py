@@ -8,6 +8,8 @@ format is:
 
 from __future__ import annotations
 
+import functools
+import sys
 from typing import NewType
 
 SpecRef = NewType("SpecRef", str)
@@ -50,7 +52,14 @@ def normalize_spec_ref(s: str) -> SpecRef:
 
     if not isinstance(s, str):
         raise TypeError("spec ref must be a str")
+    return _normalize_spec_ref_str(s)
 
+
+# Discovery, dependency inference and digests normalize the same handful of refs
+# over and over; invalid inputs raise and are therefore never cached. Results are
+# interned since they are used as dict keys throughout the graph code.
+@functools.lru_cache(maxsize=8192)
+def _normalize_spec_ref_str(s: str) -> SpecRef:
     raw = s.strip()
     if not raw:
         raise ValueError("spec ref must be non-empty")
@@ -58,10 +67,10 @@ def normalize_spec_ref(s: str) -> SpecRef:
     if ":" in raw:
         if raw.count(":") != 1:
             raise ValueError("spec ref must contain at most one ':'")
-        module, qualname = raw.split(":", 1)
+        module, _, qualname = raw.partition(":")
         if not _is_valid_module(module) or not _is_valid_qualname(qualname):
             raise ValueError("invalid spec ref")
-        return SpecRef(f"{module}:{qualname}")
+        return SpecRef(sys.intern(f"{module}:{qualname}"))
 
     # dot shorthand: split on last dot
     if "." not in raw:
@@ -70,7 +79,7 @@ def normalize_spec_ref(s: str) -> SpecRef:
     module, qualname = raw.rsplit(".", 1)
     if not _is_valid_module(module) or not _is_valid_qualname(qualname):
         raise ValueError("invalid spec ref")
-    return SpecRef(f"{module}:{qualname}")
+    return SpecRef(sys.intern(f"{module}:{qualname}"))
 
 
 def spec_ref_from_object(obj: object) -> SpecRef:
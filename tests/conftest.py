@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+_JAUNT_TEST_PROJECT_TOML = """\
+version = 1
+
+[paths]
+source_roots = ["src"]
+test_roots = ["tests"]
+generated_dir = "__generated__"
+
+[test]
+pytest_args = ["-q"]
+"""
+
+
+def _modules_under(packages: tuple[str, ...]) -> dict[str, ModuleType]:
+    return {
+        name: mod for name, mod in list(sys.modules.items()) if name.partition(".")[0] in packages
+    }
+
+
+@contextmanager
+def _isolated_imports(*packages: str) -> Iterator[None]:
+    orig_sys_path = sys.path.copy()
+    # Only modules under `packages` are touched, so snapshot just those rather
+    # than diffing all of sys.modules.
+    saved = _modules_under(packages)
+    try:
+        yield
+    finally:
+        # Restore sys.path first so we don't accidentally re-import tmp modules.
+        sys.path[:] = orig_sys_path
+        for name in _modules_under(packages):
+            del sys.modules[name]
+        sys.modules.update(saved)
+
+
+@pytest.fixture
+def isolated_imports() -> Callable[..., AbstractContextManager[None]]:
+    """Undo sys.path changes and drop newly imported modules under `packages`.
+
+    Usage: ``with isolated_imports("tests", "pkg"): ...``
+    """
+
+    return _isolated_imports
+
+
+@pytest.fixture
+def jaunt_project(tmp_path: Path) -> Path:
+    """A `jaunt test`-ready project: jaunt.toml, an empty src/ and a `tests` package."""
+
+    project = tmp_path / "proj"
+    (project / "src").mkdir(parents=True)
+    (project / "tests").mkdir()
+    (project / "jaunt.toml").write_text(_JAUNT_TEST_PROJECT_TOML, encoding="utf-8")
+    (project / "tests" / "__init__.py").write_text("", encoding="utf-8")
+    return project
+
+
+@pytest.fixture(scope="session")
+def minimal_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A read-only project whose jaunt.toml contains only `version = 1`."""
+
+    root = tmp_path_factory.mktemp("min_proj")
+    (root / "jaunt.toml").write_text("version = 1\n", encoding="utf-8")
+    return root
+
+
+@pytest.fixture(scope="session")
+def run_async() -> Iterator[Callable[[Coroutine[Any, Any, Any]], Any]]:
+    """Run a coroutine to completion on one event loop shared by the session.
+
+    Drop-in for ``asyncio.run`` without creating and tearing down a loop per call.
+    """
+
+    with asyncio.Runner() as runner:
+        yield runner.run
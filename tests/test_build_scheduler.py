@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import asyncio
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -49,7 +50,9 @@ class FakeBackend(GeneratorBackend):
         return "\n".join(lines).rstrip() + "\n"
 
 
-def test_scheduler_respects_dependency_order_jobs_1(tmp_path: Path) -> None:
+def test_scheduler_respects_dependency_order_jobs_1(
+    tmp_path: Path, run_async: Callable[..., Any]
+) -> None:
     src = tmp_path / "src"
 
     # Two modules: a depends on nothing; b depends on a.
@@ -68,7 +71,7 @@ def test_scheduler_respects_dependency_order_jobs_1(tmp_path: Path) -> None:
     module_dag = {"pkg.a": set(), "pkg.b": {"pkg.a"}}
 
     backend = FakeBackend()
-    report = asyncio.run(
+    report = run_async(
         run_build(
             package_dir=src,
             generated_dir="__generated__",
@@ -87,7 +90,7 @@ def test_scheduler_respects_dependency_order_jobs_1(tmp_path: Path) -> None:
     assert backend.calls == ["pkg.a", "pkg.b"]
 
 
-def test_non_stale_modules_are_skipped(tmp_path: Path) -> None:
+def test_non_stale_modules_are_skipped(tmp_path: Path, run_async: Callable[..., Any]) -> None:
     src = tmp_path / "src"
     a_path = tmp_path / "a.py"
     _write(a_path, "def A():\n    return 1\n")
@@ -99,7 +102,7 @@ def test_non_stale_modules_are_skipped(tmp_path: Path) -> None:
     module_dag = {"pkg.a": set()}
 
     backend = FakeBackend()
-    report = asyncio.run(
+    report = run_async(
         run_build(
             package_dir=src,
             generated_dir="__generated__",
@@ -118,7 +121,7 @@ def test_non_stale_modules_are_skipped(tmp_path: Path) -> None:
     assert backend.calls == []
 
 
-def test_scheduler_cycle_raises(tmp_path: Path) -> None:
+def test_scheduler_cycle_raises(tmp_path: Path, run_async: Callable[..., Any]) -> None:
     src = tmp_path / "src"
 
     a_path = tmp_path / "a.py"
@@ -136,7 +139,7 @@ def test_scheduler_cycle_raises(tmp_path: Path) -> None:
 
     backend = FakeBackend()
     with pytest.raises(JauntDependencyCycleError):
-        asyncio.run(
+        run_async(
             run_build(
                 package_dir=src,
                 generated_dir="__generated__",
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 import jaunt.cli
 
 
@@ -76,11 +78,20 @@ def test_main_returns_version_exit_code_zero() -> None:
     assert jaunt.cli.main(["--version"]) == 0
 
 
-def test_main_dispatches_build(monkeypatch) -> None:
-    monkeypatch.setattr(jaunt.cli, "cmd_build", lambda args: 3)
-    assert jaunt.cli.main(["build"]) == 3
+def test_dispatch_table_maps_subcommands() -> None:
+    assert jaunt.cli._DISPATCH["build"] is jaunt.cli.cmd_build
+    assert jaunt.cli._DISPATCH["test"] is jaunt.cli.cmd_test
+
+
+@pytest.mark.parametrize(("command", "code"), [("build", 3), ("test", 4)])
+def test_main_dispatches_subcommand(monkeypatch, command: str, code: int) -> None:
+    monkeypatch.setitem(jaunt.cli._DISPATCH, command, lambda args: code)
+    assert jaunt.cli.main([command]) == code
 
 
-def test_main_dispatches_test(monkeypatch) -> None:
-    monkeypatch.setattr(jaunt.cli, "cmd_test", lambda args: 4)
-    assert jaunt.cli.main(["test"]) == 4
+def test_parse_args_reuses_parser_without_leaking_state() -> None:
+    first = jaunt.cli.parse_args(["build", "--target", "pkg.a"])
+    second = jaunt.cli.parse_args(["build"])
+    assert first.target == ["pkg.a"]
+    assert second.target == []
+    assert jaunt.cli._get_parser() is jaunt.cli._get_parser()
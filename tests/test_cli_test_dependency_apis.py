@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import sys
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from pathlib import Path
 
 import pytest
@@ -24,49 +25,21 @@ class AssertingBackend(GeneratorBackend):
         assert any(str(ref).startswith("api_mod:") for ref in ctx.dependency_apis)
 
         # Minimal passing pytest module.
-        lines: list[str] = []
-        for name in ctx.expected_names:
-            lines.append(f"def {name}() -> None:\n    assert True\n")
-        return "\n".join(lines).rstrip() + "\n"
-
-
-def _restore_module(name: str, original, *, existed: bool) -> None:
-    if existed:
-        assert original is not None
-        sys.modules[name] = original
-    else:
-        sys.modules.pop(name, None)
+        body = "\n".join(f"def {name}() -> None:\n    assert True\n" for name in ctx.expected_names)
+        return body.rstrip() + "\n"
 
 
 def test_jaunt_test_passes_magic_dependency_apis_to_test_generation(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    jaunt_project: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    isolated_imports: Callable[..., AbstractContextManager[None]],
 ) -> None:
-    project = tmp_path / "proj"
-    project.mkdir(parents=True, exist_ok=True)
-
-    _write(
-        project / "jaunt.toml",
-        "\n".join(
-            [
-                "version = 1",
-                "",
-                "[paths]",
-                "source_roots = [\"src\"]",
-                "test_roots = [\"tests\"]",
-                "generated_dir = \"__generated__\"",
-                "",
-                "[test]",
-                "pytest_args = [\"-q\"]",
-                "",
-            ]
-        ),
-    )
+    project = jaunt_project
 
     # src/api_mod.py includes a magic spec that should be discovered and threaded
     # into test generation as dependency_apis.
     _write(project / "src" / "api_mod.py", "import jaunt\n\n@jaunt.magic()\ndef foo(x: int) -> int:\n    raise RuntimeError('stub')\n")
 
-    _write(project / "tests" / "__init__.py", "")
     _write(
         project / "tests" / "specs_mod.py",
         "\n".join(
@@ -85,11 +58,7 @@ def test_jaunt_test_passes_magic_dependency_apis_to_test_generation(
 
     monkeypatch.setattr(jaunt.cli, "_build_backend", lambda cfg: AssertingBackend())
 
-    orig_sys_path = list(sys.path)
-    orig_tests_mod = sys.modules.get("tests")
-    had_tests = "tests" in sys.modules
-    before_modules = set(sys.modules.keys())
-    try:
+    with isolated_imports("tests", "api_mod"):
         rc = jaunt.cli.main(
             [
                 "test",
@@ -100,10 +69,3 @@ def test_jaunt_test_passes_magic_dependency_apis_to_test_generation(
             ]
         )
         assert rc == 0
-    finally:
-        sys.path[:] = orig_sys_path
-        for name in set(sys.modules.keys()) - before_modules:
-            if name in ("tests", "api_mod") or name.startswith("tests."):
-                sys.modules.pop(name, None)
-        _restore_module("tests", orig_tests_mod, existed=had_tests)
-
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import sys
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from pathlib import Path
 
 import pytest
@@ -19,48 +20,17 @@ class FakeBackend(GeneratorBackend):
         self, ctx: ModuleSpecContext, *, extra_error_context: list[str] | None = None
     ) -> str:
         # Generate a minimal pytest module that defines all expected test functions.
-        lines: list[str] = []
-        for name in ctx.expected_names:
-            lines.append(f"def {name}() -> None:\n    assert True\n")
-        return "\n".join(lines).rstrip() + "\n"
-
-
-def _restore_module(name: str, original, *, existed: bool) -> None:
-    if existed:
-        assert original is not None
-        sys.modules[name] = original
-    else:
-        sys.modules.pop(name, None)
+        body = "\n".join(f"def {name}() -> None:\n    assert True\n" for name in ctx.expected_names)
+        return body.rstrip() + "\n"
 
 
 def test_jaunt_test_discovers_tests_package_when_test_roots_is_tests(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    jaunt_project: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    isolated_imports: Callable[..., AbstractContextManager[None]],
 ) -> None:
-    project = tmp_path / "proj"
-    project.mkdir(parents=True, exist_ok=True)
-
-    _write(
-        project / "jaunt.toml",
-        "\n".join(
-            [
-                "version = 1",
-                "",
-                "[paths]",
-                "source_roots = [\"src\"]",
-                "test_roots = [\"tests\"]",
-                "generated_dir = \"__generated__\"",
-                "",
-                "[test]",
-                "pytest_args = [\"-q\"]",
-                "",
-            ]
-        ),
-    )
-
-    # Satisfy config validation (at least one source root must exist).
-    (project / "src").mkdir(parents=True, exist_ok=True)
+    project = jaunt_project
 
-    _write(project / "tests" / "__init__.py", "")
     _write(
         project / "tests" / "specs_mod.py",
         "\n".join(
@@ -80,11 +50,7 @@ def test_jaunt_test_discovers_tests_package_when_test_roots_is_tests(
 
     monkeypatch.setattr(jaunt.cli, "_build_backend", lambda cfg: FakeBackend())
 
-    orig_sys_path = list(sys.path)
-    orig_tests_mod = sys.modules.get("tests")
-    had_tests = "tests" in sys.modules
-    before_modules = set(sys.modules.keys())
-    try:
+    with isolated_imports("tests"):
         rc = jaunt.cli.main(
             [
                 "test",
@@ -95,10 +61,3 @@ def test_jaunt_test_discovers_tests_package_when_test_roots_is_tests(
             ]
         )
         assert rc == 0
-    finally:
-        sys.path[:] = orig_sys_path
-        for name in set(sys.modules.keys()) - before_modules:
-            if name == "tests" or name.startswith("tests."):
-                sys.modules.pop(name, None)
-        _restore_module("tests", orig_tests_mod, existed=had_tests)
-
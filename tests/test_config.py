@@ -7,10 +7,52 @@ import pytest
 from jaunt.config import find_project_root, load_config
 from jaunt.errors import JauntConfigError
 
+_OVERRIDES_TOML = """\
+version = 1
 
-def test_load_minimal_config_defaults_apply(tmp_path: Path) -> None:
-    (tmp_path / "jaunt.toml").write_text("version = 1\n", encoding="utf-8")
-    cfg = load_config(root=tmp_path)
+[paths]
+source_roots = ["src"]
+test_roots = ["t"]
+generated_dir = "__gen__"
+
+[llm]
+provider = "openai"
+model = "gpt-4.1-mini"
+api_key_env = "X_API_KEY"
+
+[build]
+jobs = 2
+infer_deps = false
+
+[test]
+jobs = 3
+infer_deps = false
+pytest_args = ["-q", "-x"]
+
+[prompts]
+build_system = "bs"
+build_module = "bm"
+test_system = "ts"
+test_module = "tm"
+"""
+
+_BAD_GENERATED_DIR_TOML = """\
+version = 1
+
+[paths]
+generated_dir = "not-an-ident!"
+"""
+
+_ZERO_JOBS_TOML = """\
+version = 1
+
+[build]
+jobs = 0
+"""
+
+
+def test_load_minimal_config_defaults_apply(minimal_project: Path) -> None:
+    cfg = load_config(root=minimal_project)
 
     assert cfg.version == 1
     assert cfg.paths.source_roots == ["src", "."]
@@ -35,44 +77,9 @@ def test_load_minimal_config_defaults_apply(tmp_path: Path) -> None:
 
 
 def test_load_config_overrides_work(tmp_path: Path) -> None:
-    (tmp_path / "jaunt.toml").write_text(
-        "\n".join(
-            [
-                "version = 1",
-                "",
-                "[paths]",
-                'source_roots = ["src"]',
-                'test_roots = ["t"]',
-                'generated_dir = "__gen__"',
-                "",
-                "[llm]",
-                'provider = "openai"',
-                'model = "gpt-4.1-mini"',
-                'api_key_env = "X_API_KEY"',
-                "",
-                "[build]",
-                "jobs = 2",
-                "infer_deps = false",
-                "",
-                "[test]",
-                "jobs = 3",
-                "infer_deps = false",
-                'pytest_args = ["-q", "-x"]',
-                "",
-                "[prompts]",
-                'build_system = "bs"',
-                'build_module = "bm"',
-                'test_system = "ts"',
-                'test_module = "tm"',
-                "",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
     (tmp_path / "src").mkdir()
 
-    cfg = load_config(root=tmp_path)
+    cfg = load_config(root=tmp_path, toml_text=_OVERRIDES_TOML)
     assert cfg.paths.source_roots == ["src"]
     assert cfg.paths.test_roots == ["t"]
     assert cfg.paths.generated_dir == "__gen__"
@@ -100,6 +107,27 @@ def test_invalid_toml_raises(tmp_path: Path) -> None:
         load_config(root=tmp_path)
 
 
+def test_toml_text_skips_reading_config_file(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    cfg = load_config(root=tmp_path, toml_text="version = 1\n")
+    assert not (tmp_path / "jaunt.toml").exists()
+    assert cfg.paths.generated_dir == "__generated__"
+
+    with pytest.raises(JauntConfigError) as ei:
+        load_config(root=tmp_path, toml_text="version = \n")
+    assert "in-memory config text" in str(ei.value)
+    assert "jaunt.toml" not in str(ei.value)
+
+
+def test_toml_text_requires_root_and_rejects_config_path(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="requires root"):
+        load_config(toml_text="version = 1\n")
+    with pytest.raises(ValueError, match="config_path"):
+        load_config(root=tmp_path, config_path=tmp_path / "jaunt.toml", toml_text="version = 1\n")
+    with pytest.raises(ValueError, match="requires root"):
+        load_config(config_path=tmp_path / "jaunt.toml", toml_text="version = 1\n")
+
+
 def test_missing_config_raises(tmp_path: Path) -> None:
     with pytest.raises(JauntConfigError):
         load_config(config_path=tmp_path / "jaunt.toml")
@@ -125,37 +153,11 @@ def test_find_project_root_failure(tmp_path: Path) -> None:
 
 
 def test_validation_bad_generated_dir_raises(tmp_path: Path) -> None:
-    (tmp_path / "jaunt.toml").write_text(
-        "\n".join(
-            [
-                "version = 1",
-                "",
-                "[paths]",
-                'generated_dir = "not-an-ident!"',
-                "",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
     with pytest.raises(JauntConfigError):
-        load_config(root=tmp_path)
+        load_config(root=tmp_path, toml_text=_BAD_GENERATED_DIR_TOML)
 
 
 def test_validation_jobs_must_be_ge_1(tmp_path: Path) -> None:
-    (tmp_path / "jaunt.toml").write_text(
-        "\n".join(
-            [
-                "version = 1",
-                "",
-                "[build]",
-                "jobs = 0",
-                "",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
     with pytest.raises(JauntConfigError):
-        load_config(root=tmp_path)
+        load_config(root=tmp_path, toml_text=_ZERO_JOBS_TOML)
 
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from jaunt.deps import build_spec_graph, collapse_to_module_dag, toposort
+import ast
+from pathlib import Path
+
+import pytest
+
+from jaunt.deps import build_spec_graph, collapse_to_module_dag, find_cycles, toposort
 from jaunt.errors import JauntDependencyCycleError
 from jaunt.registry import SpecEntry
 from jaunt.spec_ref import normalize_spec_ref
@@ -13,13 +18,14 @@ def _entry(
     module: str,
     qualname: str,
     decorator_kwargs: dict[str, object] | None = None,
+    source_file: str = "/fake/source.py",
 ) -> SpecEntry:
     return SpecEntry(
         kind=kind,  # type: ignore[arg-type]
         spec_ref=normalize_spec_ref(spec_ref),
         module=module,
         qualname=qualname,
-        source_file="/fake/source.py",
+        source_file=source_file,
         obj=object(),
         decorator_kwargs=decorator_kwargs or {},
     )
@@ -52,6 +58,49 @@ def test_build_spec_graph_explicit_deps_normalizes_and_ignores_missing() -> None
     assert g[b.spec_ref] == set()
 
 
+def test_build_spec_graph_infers_deps_from_one_parse_per_module(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "mod.py"
+    src.write_text(
+        "import pkg.other as o\n"
+        "def helper():\n    return 1\n"
+        "def user():\n    return helper() + o.Other()\n"
+        "def helper():\n    return 2\n",
+        encoding="utf-8",
+    )
+    other = _entry(kind="magic", spec_ref="pkg.other:Other", module="pkg.other", qualname="Other")
+    entries = [other] + [
+        _entry(
+            kind="magic",
+            spec_ref=f"pkg.mod:{name}",
+            module="pkg.mod",
+            qualname=name,
+            source_file=str(src),
+        )
+        for name in ("helper", "user")
+    ]
+    specs = {e.spec_ref: e for e in entries}
+
+    parsed: list[str] = []
+    real_parse = ast.parse
+
+    def counting_parse(source, filename="<unknown>", *args, **kwargs):  # noqa: ANN001
+        parsed.append(str(filename))
+        return real_parse(source, filename, *args, **kwargs)
+
+    monkeypatch.setattr(ast, "parse", counting_parse)
+    g = build_spec_graph(specs, infer_default=True)
+
+    assert parsed.count(str(src)) == 1
+    # First top-level definition wins, so `helper` has no inferred deps.
+    assert g[normalize_spec_ref("pkg.mod:user")] == {
+        normalize_spec_ref("pkg.mod:helper"),
+        other.spec_ref,
+    }
+    assert g[normalize_spec_ref("pkg.mod:helper")] == set()
+
+
 def test_collapse_to_module_dag_no_self_edges_and_all_keys_present() -> None:
     a = normalize_spec_ref("m.one:A")
     b = normalize_spec_ref("m.one:B")
@@ -69,10 +118,23 @@ def test_collapse_to_module_dag_no_self_edges_and_all_keys_present() -> None:
     assert mg["m.two"] == set()
 
 
-def test_toposort_respects_dependencies() -> None:
-    g = {"a": {"b", "c"}, "b": {"c"}, "c": set()}
-    order = toposort(g)
-    assert order.index("c") < order.index("b") < order.index("a")
+@pytest.mark.parametrize(
+    ("graph", "before"),
+    [
+        ({"a": {"b", "c"}, "b": {"c"}, "c": set()}, [("c", "b"), ("b", "a")]),
+        ({"x": {"y"}, "y": set()}, [("y", "x")]),
+        ({"a": {"b", "c"}, "b": {"d"}, "c": {"d"}, "d": set()}, [("d", "b"), ("d", "c")]),
+        ({"a": {"b"}}, [("b", "a")]),  # dependency missing from the keys
+    ],
+    ids=["chain", "pair", "diamond", "implicit-leaf"],
+)
+def test_toposort_respects_dependencies(
+    graph: dict[str, set[str]], before: list[tuple[str, str]]
+) -> None:
+    order = toposort(graph)
+    assert len(order) == len(set(order))
+    for dep, dependent in before:
+        assert order.index(dep) < order.index(dependent)
 
 
 def test_toposort_cycle_raises_with_participants() -> None:
@@ -85,3 +147,38 @@ def test_toposort_cycle_raises_with_participants() -> None:
     else:  # pragma: no cover
         raise AssertionError("expected cycle error")
 
+
+def test_toposort_deep_chain_and_cycle_path_past_acyclic_prefix() -> None:
+    chain = {i: {i + 1} for i in range(5000)}
+    assert toposort(chain) == list(range(5000, -1, -1))
+
+    g = {"x": {"a"}, "a": {"b", "d"}, "b": {"c"}, "c": {"a"}, "d": set()}
+    with pytest.raises(JauntDependencyCycleError, match=r"a -> b -> c -> a$"):
+        toposort(g)
+
+
+def test_find_cycles_detects_self_loop() -> None:
+    assert find_cycles({"a": {"a"}, "b": {"a"}}) == [["a"]]
+
+
+def test_find_cycles_reports_each_cycle_once() -> None:
+    g = {
+        "a": {"b"},
+        "b": {"c"},
+        "c": {"a", "d"},
+        "d": {"e"},
+        "e": {"d"},
+        "f": {"a"},
+    }
+    assert find_cycles(g) == [["a", "b", "c"], ["d", "e"]]
+
+
+def test_find_cycles_acyclic_and_deep_chain() -> None:
+    assert find_cycles({"a": {"b", "c"}, "b": {"c"}, "c": set()}) == []
+
+    n = 5000  # deeper than the default recursion limit
+    chain = {i: {i + 1} for i in range(n)}
+    assert find_cycles(chain) == []
+    chain[n] = {0}
+    (cycle,) = find_cycles(chain)
+    assert len(cycle) == n + 1
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import hashlib
 import re
 from pathlib import Path
 
+from jaunt import digest
 from jaunt.deps import build_spec_graph
 from jaunt.digest import graph_digest, local_digest, module_digest
 from jaunt.registry import SpecEntry
@@ -157,3 +159,57 @@ def B():
     assert m1 == m2
     assert re.fullmatch(r"[0-9a-f]{64}", m1) is not None
 
+
+def test_digest_payload_layout_is_stable(tmp_path: Path) -> None:
+    # Digests are persisted in generated headers; changing the hashed byte layout
+    # would force every generated module to be rebuilt.
+    p = tmp_path / "m.py"
+    _write(p, "def A():\n    return 1\n\ndef B():\n    return A()\n")
+    a = _entry(kind="magic", spec_ref="m:A", module="m", qualname="A", source_file=str(p))
+    b = _entry(
+        kind="magic",
+        spec_ref="m:B",
+        module="m",
+        qualname="B",
+        source_file=str(p),
+        decorator_kwargs={"deps": ["m:A"]},
+    )
+    specs = {a.spec_ref: a, b.spec_ref: b}
+    spec_graph = build_spec_graph(specs, infer_default=False)
+
+    def sha(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    assert local_digest(b) == sha('def B():\n    return A()\n{"deps":["m:A"]}')
+    ga = sha(local_digest(a) + "\n")
+    gb = sha(local_digest(b) + "\n" + ga)
+    assert graph_digest(a.spec_ref, specs, spec_graph) == ga
+    assert graph_digest(b.spec_ref, specs, spec_graph) == gb
+    assert module_digest("m", [a, b], specs, spec_graph) == sha("\n".join(sorted([ga, gb])))
+
+
+def test_local_digest_ignores_newline_style(tmp_path: Path) -> None:
+    lf = tmp_path / "lf.py"
+    crlf = tmp_path / "crlf.py"
+    lf.write_bytes(b"def Foo():\n    return 1\n")
+    crlf.write_bytes(b"def Foo():\r\n    return 1\r\n")
+    digests = {
+        local_digest(
+            _entry(kind="magic", spec_ref="m:Foo", module="m", qualname="Foo", source_file=str(p))
+        )
+        for p in (lf, crlf)
+    }
+    assert len(digests) == 1
+
+
+def test_parsed_source_cache_is_bounded(tmp_path: Path) -> None:
+    for i in range(digest._PARSED_SOURCES_MAX + 5):
+        p = tmp_path / f"m{i}.py"
+        _write(p, "def Foo():\n    return 1\n")
+        e = _entry(
+            kind="magic", spec_ref=f"m{i}:Foo", module=f"m{i}", qualname="Foo", source_file=str(p)
+        )
+        local_digest(e)
+
+    assert len(digest._PARSED_SOURCES) <= digest._PARSED_SOURCES_MAX
+    assert str(p) in digest._PARSED_SOURCES
@@ -52,6 +52,18 @@ def test_discover_modules_honors_exclude_globs(tmp_path: Path) -> None:
     assert ".venv.site" not in mods
 
 
+def test_discover_modules_nested_packages_and_pruned_dirs(tmp_path: Path) -> None:
+    _write(tmp_path / "pkg" / "__init__.py", "")
+    _write(tmp_path / "pkg" / "sub" / "__init__.py", "")
+    _write(tmp_path / "pkg" / "sub" / "deep.py", "")
+    _write(tmp_path / "pkg" / "notes.txt", "")
+    _write(tmp_path / "build" / "lib" / "pkg" / "copy.py", "")
+
+    mods = discover_modules(roots=[tmp_path], exclude=["build/**"], generated_dir="__generated__")
+
+    assert mods == ["pkg", "pkg.sub", "pkg.sub.deep"]
+
+
 def test_discover_modules_with_module_prefix(tmp_path: Path) -> None:
     _write(tmp_path / "tests" / "__init__.py", "")
     _write(tmp_path / "tests" / "specs_mod.py", "X = 1\n")
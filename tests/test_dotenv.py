@@ -33,6 +33,23 @@ def test_load_dotenv_parses_simple_lines(tmp_path: Path) -> None:
     assert "NOEQUALS" not in vals
 
 
+def test_load_dotenv_edge_cases_match_line_semantics(tmp_path: Path) -> None:
+    p = tmp_path / ".env"
+    p.write_text(
+        "  # SKIPPED=1\r\n  SPACED = two words \r\nURL=http://x?a=b # kept\n=nokey\nA-B=1\n",
+        encoding="utf-8",
+    )
+
+    assert load_dotenv(p) == {"SPACED": "two words", "URL": "http://x?a=b # kept", "A-B": "1"}
+
+
+def test_load_dotenv_splits_on_all_line_boundaries(tmp_path: Path) -> None:
+    p = tmp_path / ".env"
+    p.write_text("A=1\x0cB=2\x0bC=3\x85D=4\u2028E=5\n", encoding="utf-8")
+
+    assert load_dotenv(p) == {"A": "1", "B": "2", "C": "3", "D": "4", "E": "5"}
+
+
 def test_load_dotenv_into_environ_does_not_override_existing(monkeypatch, tmp_path: Path) -> None:
     p = tmp_path / ".env"
     p.write_text("A=1\nB=2\n", encoding="utf-8")
@@ -49,4 +66,3 @@ def test_load_dotenv_into_environ_does_not_override_existing(monkeypatch, tmp_pa
 def test_load_dotenv_into_environ_returns_false_when_missing(tmp_path: Path) -> None:
     p = tmp_path / "missing.env"
     assert load_dotenv_into_environ(p) is False
-
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import asyncio
-
 from jaunt.generate.base import GeneratorBackend, ModuleSpecContext
 
 
@@ -21,7 +19,7 @@ class DummyBackend(GeneratorBackend):
         return "def foo():\n    return 1\n"
 
 
-def test_generate_with_retry_calls_twice_and_succeeds() -> None:
+def test_generate_with_retry_calls_twice_and_succeeds(run_async) -> None:
     backend = DummyBackend()
     ctx = ModuleSpecContext(
         kind="build",
@@ -34,7 +32,7 @@ def test_generate_with_retry_calls_twice_and_succeeds() -> None:
         dependency_generated_modules={},
     )
 
-    res = asyncio.run(backend.generate_with_retry(ctx))
+    res = run_async(backend.generate_with_retry(ctx))
     assert backend.calls == 2
     assert res.attempts == 2
     assert res.source is not None and "def foo" in res.source
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
 
-from jaunt.header import HEADER_MARKER, extract_module_digest, format_header, parse_header
+from jaunt.header import (
+    HEADER_MARKER,
+    extract_module_digest,
+    format_header,
+    parse_header,
+    read_header,
+)
+
+_SPEC_REFS = ["my_project.feature:Thing", "my_project.feature:other"]
 
 
 def test_format_header_emits_exact_lines_and_parse_roundtrips() -> None:
@@ -11,19 +20,17 @@ def test_format_header_emits_exact_lines_and_parse_roundtrips() -> None:
         kind="build",
         source_module="my_project.feature",
         module_digest="deadbeef",
-        spec_refs=["my_project.feature:Thing", "my_project.feature:other"],
+        spec_refs=_SPEC_REFS,
     )
 
-    lines = hdr.splitlines()
-    assert lines[0] == HEADER_MARKER
-    assert lines[1] == "# jaunt:tool_version=0.1.0"
-    assert lines[2] == "# jaunt:kind=build"
-    assert lines[3] == "# jaunt:source_module=my_project.feature"
-    assert lines[4] == "# jaunt:module_digest=sha256:deadbeef"
-    assert lines[5] == "# jaunt:spec_refs=" + json.dumps(
-        ["my_project.feature:Thing", "my_project.feature:other"], ensure_ascii=True
+    assert tuple(hdr.splitlines()) == (
+        HEADER_MARKER,
+        "# jaunt:tool_version=0.1.0",
+        "# jaunt:kind=build",
+        "# jaunt:source_module=my_project.feature",
+        "# jaunt:module_digest=sha256:deadbeef",
+        "# jaunt:spec_refs=" + json.dumps(_SPEC_REFS, ensure_ascii=True),
     )
-    assert len(lines) == 6
 
     parsed = parse_header(hdr + "\nprint('ok')\n")
     assert parsed is not None
@@ -31,10 +38,7 @@ def test_format_header_emits_exact_lines_and_parse_roundtrips() -> None:
     assert parsed["kind"] == "build"
     assert parsed["source_module"] == "my_project.feature"
     assert parsed["module_digest"] == "sha256:deadbeef"
-    assert json.loads(parsed["spec_refs"]) == [
-        "my_project.feature:Thing",
-        "my_project.feature:other",
-    ]
+    assert json.loads(parsed["spec_refs"]) == _SPEC_REFS
 
 
 def test_parse_header_returns_none_without_marker() -> None:
@@ -51,3 +55,23 @@ def test_extract_module_digest() -> None:
     )
     assert extract_module_digest(hdr + "x=1\n") == "sha256:abc123"
     assert extract_module_digest("x=1\n") is None
+
+
+def test_read_header_only_looks_at_the_header(tmp_path: Path) -> None:
+    hdr = format_header(
+        tool_version="0.1.0",
+        kind="build",
+        source_module="pkg.mod",
+        module_digest="abc123",
+        spec_refs=["pkg.mod:f"],
+    )
+    generated = tmp_path / "gen.py"
+    generated.write_text(hdr + "\n# jaunt:not_header=1\ndef f():\n    return 1\n", encoding="utf-8")
+    plain = tmp_path / "plain.py"
+    plain.write_text("x = 1\n", encoding="utf-8")
+
+    parsed = read_header(generated)
+    assert parsed == parse_header(hdr)
+    assert parsed is not None
+    assert "not_header" not in parsed
+    assert read_header(plain) is None
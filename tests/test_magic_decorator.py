@@ -21,6 +21,23 @@ class TopLevelClass:
         self.x = x
 
 
+_TOP_LEVEL_FN_REF = normalize_spec_ref(f"{top_level_fn.__module__}:{top_level_fn.__qualname__}")
+_TOP_LEVEL_CLASS_REF = normalize_spec_ref(
+    f"{TopLevelClass.__module__}:{TopLevelClass.__qualname__}"
+)
+
+
+def _raise_missing(name: str) -> Any:
+    raise ModuleNotFoundError(name)
+
+
+@pytest.fixture
+def missing_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make every generated-module import fail, i.e. nothing has been built."""
+
+    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _raise_missing)
+
+
 @pytest.fixture(autouse=True)
 def _clear_registries() -> Generator[None, None, None]:
     clear_registries()
@@ -28,76 +45,43 @@ def _clear_registries() -> Generator[None, None, None]:
     clear_registries()
 
 
-def test_registers_function_spec(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_registers_function_spec(missing_import: None) -> None:
     wrapped = magic()(top_level_fn)
     reg = get_magic_registry()
-    expected_ref = normalize_spec_ref(f"{top_level_fn.__module__}:{top_level_fn.__qualname__}")
-    assert expected_ref in reg
-    assert reg[expected_ref].kind == "magic"
+    assert _TOP_LEVEL_FN_REF in reg
+    assert reg[_TOP_LEVEL_FN_REF].kind == "magic"
     assert callable(wrapped)
 
 
-def test_registers_class_spec(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_registers_class_spec(missing_import: None) -> None:
     cls = magic()(TopLevelClass)
     reg = get_magic_registry()
-    expected_ref = normalize_spec_ref(f"{TopLevelClass.__module__}:{TopLevelClass.__qualname__}")
-    assert expected_ref in reg
+    assert _TOP_LEVEL_CLASS_REF in reg
     assert isinstance(cls, type)
 
 
-def test_unbuilt_function_call_raises_actionable_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_unbuilt_function_call_raises_actionable_error(missing_import: None) -> None:
     wrapped = magic()(top_level_fn)
     with pytest.raises(JauntNotBuiltError) as exc:
         wrapped(1)
     assert "jaunt build" in str(exc.value)
 
 
-def test_unbuilt_class_instantiation_raises(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_unbuilt_class_instantiation_raises(missing_import: None) -> None:
     Placeholder = magic()(TopLevelClass)
     with pytest.raises(JauntNotBuiltError):
         Placeholder(1)
 
 
-def test_wrapper_preserves_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_wrapper_preserves_metadata(missing_import: None) -> None:
     wrapped = magic()(top_level_fn)
     assert wrapped.__name__ == top_level_fn.__name__
     assert wrapped.__wrapped__ is top_level_fn
 
 
-def test_decorator_kwargs_are_stored(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_decorator_kwargs_are_stored(missing_import: None) -> None:
     magic(deps="pkg.mod:Dep", prompt="hello", infer_deps=False)(top_level_fn)
-    expected_ref = normalize_spec_ref(f"{top_level_fn.__module__}:{top_level_fn.__qualname__}")
-    got = get_magic_registry()[expected_ref]
+    got = get_magic_registry()[_TOP_LEVEL_FN_REF]
     assert got.decorator_kwargs == {"deps": "pkg.mod:Dep", "prompt": "hello", "infer_deps": False}
 
 
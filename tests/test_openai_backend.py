@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import asyncio
+from typing import Any
 
 import pytest
 
@@ -9,41 +9,48 @@ from jaunt.errors import JauntConfigError
 from jaunt.generate.base import ModuleSpecContext
 from jaunt.generate.openai_backend import OpenAIBackend
 
+_EXPECTED_NAMES = ("foo", "BAR")
 
-def _ctx(kind: str) -> ModuleSpecContext:
-    return ModuleSpecContext(
-        kind=kind,  # type: ignore[arg-type]
-        spec_module="pkg.specs",
-        generated_module="__generated__.pkg.specs",
-        expected_names=["foo", "BAR"],
-        spec_sources={},
-        decorator_prompts={},
-        dependency_apis={},
-        dependency_generated_modules={},
-    )
 
+def _ctx(kind: str, **overrides: Any) -> ModuleSpecContext:
+    fields: dict[str, Any] = {
+        "kind": kind,
+        "spec_module": "pkg.specs",
+        "generated_module": "__generated__.pkg.specs",
+        "expected_names": list(_EXPECTED_NAMES),
+        "spec_sources": {},
+        "decorator_prompts": {},
+        "dependency_apis": {},
+        "dependency_generated_modules": {},
+    }
+    fields.update(overrides)
+    return ModuleSpecContext(**fields)
+
+
+@pytest.fixture(scope="module")
+def backend() -> OpenAIBackend:
+    # Construction builds the SDK client and loads every prompt; do it once.
+    # Tests only patch `_call_openai`, which their own monkeypatch undoes.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OPENAI_API_KEY", "test-key")
+        return OpenAIBackend(
+            LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY")
+        )
 
-def test_openai_backend_strips_fences(monkeypatch) -> None:
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    backend = OpenAIBackend(
-        LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY")
-    )
 
+def test_openai_backend_strips_fences(monkeypatch, backend, run_async) -> None:
     async def fake_call(messages):
         assert isinstance(messages, list)
         return "```python\nprint('hi')\n```"
 
     monkeypatch.setattr(backend, "_call_openai", fake_call)
-    out = asyncio.run(backend.generate_module(_ctx("build")))
+    out = run_async(backend.generate_module(_ctx("build")))
     assert out == "print('hi')"
 
 
-def test_openai_backend_renders_expected_names_and_kind_specific_rules(monkeypatch) -> None:
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    backend = OpenAIBackend(
-        LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY")
-    )
-
+def test_openai_backend_renders_expected_names_and_kind_specific_rules(
+    monkeypatch, backend, run_async
+) -> None:
     seen: list[list[dict[str, str]]] = []
 
     async def fake_call(messages):
@@ -52,8 +59,8 @@ def test_openai_backend_renders_expected_names_and_kind_specific_rules(monkeypat
 
     monkeypatch.setattr(backend, "_call_openai", fake_call)
 
-    asyncio.run(backend.generate_module(_ctx("build")))
-    asyncio.run(backend.generate_module(_ctx("test")))
+    run_async(backend.generate_module(_ctx("build")))
+    run_async(backend.generate_module(_ctx("test")))
 
     assert len(seen) == 2
     build_msgs = seen[0]
@@ -66,8 +73,7 @@ def test_openai_backend_renders_expected_names_and_kind_specific_rules(monkeypat
 
     # Names should appear in rendered prompts.
     for blob in (build_user, test_user, build_system, test_system):
-        assert "foo" in blob
-        assert "BAR" in blob
+        assert all(name in blob for name in _EXPECTED_NAMES), blob
 
     # Build prompts: must not generate tests.
     assert ("Do not write tests" in build_system) or ("Do not generate tests" in build_user)
@@ -84,12 +90,9 @@ def test_openai_backend_errors_when_api_key_missing(monkeypatch) -> None:
     assert "Missing API key" in str(ei.value)
 
 
-def test_openai_backend_injects_skills_block_as_extra_user_message(monkeypatch) -> None:
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    backend = OpenAIBackend(
-        LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY")
-    )
-
+def test_openai_backend_injects_skills_block_as_extra_user_message(
+    monkeypatch, backend, run_async
+) -> None:
     seen: list[list[dict[str, str]]] = []
 
     async def fake_call(messages):
@@ -98,19 +101,14 @@ def test_openai_backend_injects_skills_block_as_extra_user_message(monkeypatch)
 
     monkeypatch.setattr(backend, "_call_openai", fake_call)
 
-    ctx = ModuleSpecContext(
-        kind="build",
-        spec_module="pkg.specs",
+    ctx = _ctx(
+        "build",
         generated_module="pkg.__generated__.specs",
         expected_names=["foo"],
-        spec_sources={},
-        decorator_prompts={},
-        dependency_apis={},
-        dependency_generated_modules={},
         skills_block="## requests==2.0.0\nUse requests.get(...)\n",
     )
 
-    out = asyncio.run(backend.generate_module(ctx))
+    out = run_async(backend.generate_module(ctx))
     assert "def foo" in out
     assert len(seen) == 1
     msgs = seen[0]
@@ -113,6 +113,23 @@ def test_get_specs_by_module_groups_and_sorts() -> None:
     assert grouped["m.one"] == [e2, e4, e1]
 
 
+@pytest.mark.parametrize("n", [4, 1000])
+def test_get_specs_by_module_sorts_every_group(n: int) -> None:
+    # Register in reverse so grouping has to sort rather than keep insertion order.
+    for i in reversed(range(n)):
+        mod = f"m.mod{i % 7}"
+        register_magic(
+            _entry(kind="magic", spec_ref=f"{mod}:Spec{i}", module=mod, qualname=f"Q{i % 3}")
+        )
+
+    grouped = get_specs_by_module("magic")
+    assert sum(len(entries) for entries in grouped.values()) == n
+    for mod, entries in grouped.items():
+        assert all(e.module == mod for e in entries)
+        keys = [(e.qualname, str(e.spec_ref)) for e in entries]
+        assert keys == sorted(keys)
+
+
 def test_duplicate_registration_overwrites_decorator_kwargs() -> None:
     e1 = _entry(
         kind="magic",
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 
+import jaunt.external_imports as ei
+import jaunt.skillgen as sg
+import jaunt.skills_auto as sa
 from jaunt.config import LLMConfig
 from jaunt.external_imports import discover_external_distributions
 from jaunt.skills_auto import ensure_pypi_skills_and_block, skill_md_path
 
+_LLM_CFG = LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY")
+
 
 def _write(path: Path, text: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -31,8 +35,6 @@ def test_scan_external_imports_filters_stdlib_and_internal(tmp_path: Path, monke
         ),
     )
 
-    import jaunt.external_imports as ei
-
     def fake_packages_distributions():
         return {"external_lib": ["external-lib"], "my_app": ["my-app"], "jaunt": ["jaunt"]}
 
@@ -58,14 +60,14 @@ def test_skill_path_layout(tmp_path: Path) -> None:
     ).resolve()
 
 
-def test_existing_generated_skill_same_version_skips_regen(tmp_path: Path, monkeypatch) -> None:
+def test_existing_generated_skill_same_version_skips_regen(
+    tmp_path: Path, monkeypatch, run_async
+) -> None:
     dist = "external-lib"
     version = "1.2.3"
     path = skill_md_path(project_root=tmp_path, dist=dist)
     _write(path, f"<!-- jaunt:skill=pypi dist={dist} version={version} -->\nBODY\n")
 
-    import jaunt.skills_auto as sa
-
     def fake_discover(*_a, **_k):
         return {dist: version}, []
 
@@ -75,14 +77,12 @@ def test_existing_generated_skill_same_version_skips_regen(tmp_path: Path, monke
     monkeypatch.setattr(sa, "discover_external_distributions_with_warnings", fake_discover)
     monkeypatch.setattr(sa, "fetch_readme", fail_fetch)
 
-    res = asyncio.run(
+    res = run_async(
         ensure_pypi_skills_and_block(
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(
-                provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"
-            ),
+            llm=_LLM_CFG,
         )
     )
     assert res.warnings == []
@@ -90,16 +90,15 @@ def test_existing_generated_skill_same_version_skips_regen(tmp_path: Path, monke
     assert "jaunt:skill=pypi" not in res.skills_block
 
 
-def test_existing_generated_skill_version_change_regenerates(tmp_path: Path, monkeypatch) -> None:
+def test_existing_generated_skill_version_change_regenerates(
+    tmp_path: Path, monkeypatch, run_async
+) -> None:
     dist = "external-lib"
     old_version = "0.1.0"
     new_version = "1.2.3"
     path = skill_md_path(project_root=tmp_path, dist=dist)
     _write(path, f"<!-- jaunt:skill=pypi dist={dist} version={old_version} -->\nOLD\n")
 
-    import jaunt.skillgen as sg
-    import jaunt.skills_auto as sa
-
     monkeypatch.setattr(
         sa,
         "discover_external_distributions_with_warnings",
@@ -119,14 +118,12 @@ def test_existing_generated_skill_version_change_regenerates(tmp_path: Path, mon
 
     monkeypatch.setattr(sg, "OpenAISkillGenerator", DummyGen)
 
-    res = asyncio.run(
+    res = run_async(
         ensure_pypi_skills_and_block(
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(
-                provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"
-            ),
+            llm=_LLM_CFG,
         )
     )
     assert calls == [(dist, new_version)]
@@ -138,14 +135,12 @@ def test_existing_generated_skill_version_change_regenerates(tmp_path: Path, mon
     assert "jaunt:skill=pypi" not in res.skills_block
 
 
-def test_user_managed_skill_never_overwritten(tmp_path: Path, monkeypatch) -> None:
+def test_user_managed_skill_never_overwritten(tmp_path: Path, monkeypatch, run_async) -> None:
     dist = "external-lib"
     version = "9.9.9"
     path = skill_md_path(project_root=tmp_path, dist=dist)
     _write(path, "USER SKILL\n")
 
-    import jaunt.skills_auto as sa
-
     def fake_discover(*_a, **_k):
         return {dist: version}, []
 
@@ -155,14 +150,12 @@ def test_user_managed_skill_never_overwritten(tmp_path: Path, monkeypatch) -> No
     monkeypatch.setattr(sa, "discover_external_distributions_with_warnings", fake_discover)
     monkeypatch.setattr(sa, "fetch_readme", fail_fetch)
 
-    res = asyncio.run(
+    res = run_async(
         ensure_pypi_skills_and_block(
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(
-                provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"
-            ),
+            llm=_LLM_CFG,
         )
     )
     assert path.read_text(encoding="utf-8") == "USER SKILL\n"
@@ -34,6 +34,16 @@ def test_normalize_rejects_obviously_invalid_inputs() -> None:
         normalize_spec_ref("pkg..mod:Qual")
 
 
+def test_normalize_is_stable_across_repeated_calls() -> None:
+    assert normalize_spec_ref(" pkg.mod.Thing ") == "pkg.mod:Thing"
+    assert normalize_spec_ref(" pkg.mod.Thing ") == "pkg.mod:Thing"
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            normalize_spec_ref("pkg.mod:a:b")
+    with pytest.raises(TypeError):
+        normalize_spec_ref(["pkg.mod:Thing"])  # type: ignore[arg-type]
+
+
 def test_spec_ref_from_object_function_and_class() -> None:
     def f() -> None:
         return None
@@ -44,8 +54,8 @@ def test_spec_ref_from_object_function_and_class() -> None:
     f_ref = spec_ref_from_object(f)
     c_ref = spec_ref_from_object(C)
 
-    f_mod, f_qual = f_ref.split(":", 1)
-    c_mod, c_qual = c_ref.split(":", 1)
+    f_mod, _, f_qual = f_ref.partition(":")
+    c_mod, _, c_qual = c_ref.partition(":")
 
     # Nested objects include the defining function and "<locals>" in __qualname__.
     assert f_mod == __name__
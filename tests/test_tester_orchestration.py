@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import asyncio
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from jaunt.deps import build_spec_graph
 from jaunt.generate.base import GeneratorBackend, ModuleSpecContext
@@ -38,7 +39,9 @@ class FakeBackend(GeneratorBackend):
         return "\n".join(lines).rstrip() + "\n"
 
 
-def test_tester_generates_into_tests_tree_and_runs_pytest(tmp_path: Path) -> None:
+def test_tester_generates_into_tests_tree_and_runs_pytest(
+    tmp_path: Path, run_async: Callable[..., Any]
+) -> None:
     project = tmp_path / "proj"
     (project / "src").mkdir(parents=True, exist_ok=True)
     (project / "tests").mkdir(parents=True, exist_ok=True)
@@ -61,7 +64,7 @@ def test_generated():
     module_dag = {"tests.specs_mod": set()}
 
     backend = FakeBackend()
-    report = asyncio.run(
+    report = run_async(
         run_test_generation(
             project_dir=project,
             tests_package="tests",
@@ -94,7 +97,9 @@ def test_generated():
     assert run_pytest([gen_file], pytest_args=["-q"]) == 0
 
 
-def test_run_test_generation_threads_dependency_apis_into_backend_ctx(tmp_path: Path) -> None:
+def test_run_test_generation_threads_dependency_apis_into_backend_ctx(
+    tmp_path: Path, run_async: Callable[..., Any]
+) -> None:
     project = tmp_path / "proj"
     (project / "src").mkdir(parents=True, exist_ok=True)
     (project / "tests").mkdir(parents=True, exist_ok=True)
@@ -125,7 +130,7 @@ def test_generated():
             return "def test_generated():\n    assert True\n"
 
     backend = AssertingBackend()
-    report = asyncio.run(
+    report = run_async(
         run_test_generation(
             project_dir=project,
             tests_package="tests",